@@ -1,21 +1,22 @@
 import os
 import re
 import sys
-import copy
-import glob
+import json
+import hashlib
 import operator
-import subprocess
+import functools
+import concurrent.futures
 
 import click
-from tabulate import tabulate
 
-from click_default_group import DefaultGroup
+# compile these once at import since they never change between calls
+_TOKEN_RE = re.compile(r"\{([a-z]*)\}")
+_VSPLIT_RE = re.compile(r"(\d+)")
+# built once instead of per sort call
+_DECORATED_KEY = operator.itemgetter(0)
 
 
-@click.group(cls=DefaultGroup,
-             invoke_without_command=True,
-             default_if_no_args=True
-             )
+@click.group(invoke_without_command=True)
 @click.option("templates",
               "--templates",
               envvar="APPFIND_TEMPLATES",
@@ -91,17 +92,19 @@ def cli(ctx, templates, prtokens, tsort, vdefault):
     prtokens = (prtokens.split(os.pathsep) if prtokens else [])
     tsort = (tsort.split(os.pathsep) if tsort else [])
 
-    matches = _glob_and_match(click, templates, prtokens, tsort, vdefault)
+    matches, by_tag, by_version = _glob_and_match(click, templates, prtokens, tsort, vdefault)
 
     if not matches:
         raise click.ClickException("No executables found matching templates.")
 
     ctx.obj['matches'] = matches
+    ctx.obj['by_tag'] = by_tag
+    ctx.obj['by_version'] = by_version
     ctx.obj['prtokens'] = prtokens
+    ctx.obj['tsort'] = tsort
 
 
 @cli.command("launch",
-             default=True,  # marks this as the default command
              short_help='launch the found app, latest by default',
              context_settings={"ignore_unknown_options": True,
                                "allow_extra_args": True}
@@ -132,15 +135,11 @@ def launch_command(ctx, appver, apphelp):
     this command will will launch the 'latest' non-prerelease version of the
     application unless a different 'default' is specified."""
 
-    matches = ctx.obj["matches"]
-
-    # first search the tags for the appver requested to launch
-    match = next((x for x in matches if appver in (x.get('tags') if x.get('tags') else [])), None)
-    # if we didnt find a matching tag, look for a version number that matches
-    if not match:
-        match = next((x for x in matches if x['version'] == appver), None)
+    # search the tags for the appver requested to launch, then fall back
+    # to the version numbers; both lookups are pre-indexed dicts
+    match = ctx.obj["by_tag"].get(appver) or ctx.obj["by_version"].get(appver)
     # if theres no match at all, let the user know
-    elif not match:
+    if not match:
         raise click.ClickException(f"No version found matching '{appver}'")
 
     # store any unrecognized args
@@ -153,13 +152,22 @@ def launch_command(ctx, appver, apphelp):
         extra_args.insert(0, "--help")
 
     # build that command
-    cmd = [match['path']]
+    cmd = [match.path]
     if extra_args:
         cmd.extend(extra_args)
 
     # launch!
     click.echo(f"Launching: {' '.join(cmd)}")
-    subprocess.call(cmd)
+    if os.name == 'nt':
+        # Windows can't truly replace the process, fall back to a child;
+        # only this branch ever needs subprocess, so import it here
+        import subprocess
+        subprocess.call(cmd)
+    else:
+        # replace this process with the app outright, saving a fork and
+        # keeping the wrapper's memory from lingering for the app's lifetime
+        sys.stdout.flush()
+        os.execvp(cmd[0], cmd)
 
 
 @cli.command("list",
@@ -186,15 +194,19 @@ def launch_command(ctx, appver, apphelp):
 def list_command(ctx, paths, ask):
     """Lists the versions found by appfind."""
 
-    matches = ctx.obj["matches"]
+    # only this command renders a table, keep the import cost off the
+    # launch path
+    from tabulate import tabulate
+
+    matches = _sort_matches(ctx.obj["matches"], ctx.obj["tsort"])
 
     # store any unrecognized args
     ctx.obj["args"] = click.get_current_context().args
 
-    tags_col = [", ".join(m["tags"]) if m.get("tags") else None for m in matches]
-    versions_col = [m["version"] for m in matches]
+    tags_col = [", ".join(m.tags) if m.tags else None for m in matches]
+    versions_col = [m.version for m in matches]
     launch_col = range(1, len(versions_col) + 1)
-    paths_col = [m["path"] for m in matches]
+    paths_col = [m.path for m in matches]
 
     launch_dict = {"#": launch_col}
     table_dict = {"version": versions_col, "tags": tags_col}
@@ -215,130 +227,592 @@ def list_command(ctx, paths, ask):
         ctx.invoke(launch_command, appver=appver)
 
 
+###############################################################################
+# Console entry point
+###############################################################################
+# group options that take a value; anything else routes to 'launch'
+_GROUP_OPTS = ('--templates', '--prtokens', '--tsort', '--default-version')
+
+# launch options Click would intercept even after positional app args
+_LAUNCH_OPTS = ('--appver', '--apphelp', '--help')
+
+
+def _is_bare_launch(args):
+    """
+    True when none of the arguments are launch options, meaning every
+    token would pass through to the wrapped app untouched. Tokens after
+    a '--' separator never reach Click, so the scan stops there.
+    """
+    for arg in args:
+        if arg == '--':
+            return True
+        if arg.split('=', 1)[0] in _LAUNCH_OPTS:
+            return False
+    return True
+
+
+def _route_default(args):
+    """
+    Splices the implicit 'launch' command into the arguments, doing the
+    job the DefaultGroup dependency used to: group options stay with the
+    group, an explicit command is left alone, and everything else from
+    the first unrecognized token on is handed to 'launch'.
+    """
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--help':
+            # let the group print its own help
+            return args
+        if arg in _GROUP_OPTS:
+            i += 2
+            continue
+        if arg.split('=', 1)[0] in _GROUP_OPTS:
+            i += 1
+            continue
+        if arg in cli.commands:
+            return args
+        return args[:i] + ['launch'] + args[i:]
+    return args + ['launch']
+
+
+def _fast_launch(args):
+    """
+    Handles the dominant invocation — a bare default launch with only
+    app arguments — straight from the environment variables, without
+    building the Click command tree at all. Returns without exec'ing
+    when the shape doesn't pan out (no templates, no default match, or
+    a template error), so the full CLI can take over and report it.
+    """
+    templates = os.environ.get("APPFIND_TEMPLATES")
+    if not templates:
+        return
+    prtokens = os.environ.get("APPFIND_PR_TOKENS")
+    tsort = os.environ.get("APPFIND_TOKEN_SORT")
+    vdefault = os.environ.get("APPFIND_DEFAULT_VERSION")
+    try:
+        matches, by_tag, by_version = _glob_and_match(
+            click,
+            templates.split(os.pathsep),
+            prtokens.split(os.pathsep) if prtokens else [],
+            tsort.split(os.pathsep) if tsort else [],
+            vdefault,
+        )
+    except click.ClickException:
+        return
+    match = by_tag.get('default')
+    if match is None:
+        return
+    cmd = [match.path] + list(args)
+    click.echo(f"Launching: {' '.join(cmd)}")
+    sys.stdout.flush()
+    os.execvp(cmd[0], cmd)
+
+
+def main():
+    """Console script entry point."""
+    args = sys.argv[1:]
+    # the common case is a plain default launch; on POSIX that can exec
+    # without paying for Click's command tree construction and parsing
+    if (os.name != 'nt'
+            and (not args or not (args[0].startswith('-') or args[0] in cli.commands))
+            and _is_bare_launch(args)):
+        _fast_launch(args)
+    cli(args=_route_default(args))
+
+
+class _AppMatch:
+    """
+    One executable discovered for a template: its path, the version
+    string built from the captured tokens, the precomputed sort key, the
+    token values themselves and any tags applied during tagging. A
+    __slots__ record instead of a dict so a tree with hundreds of
+    installed versions doesn't pay full dict overhead per match.
+    """
+
+    __slots__ = ('path', 'version', 'vkey', 'tokens', 'tags')
+
+    def __init__(self, path, version, vkey, tokens, tags=None):
+        self.path = path
+        self.version = version
+        self.vkey = vkey
+        self.tokens = tokens
+        self.tags = tags if tags is not None else []
+
+    def to_dict(self):
+        """Serializes the match for the on-disk cache."""
+        return {"path": self.path, "version": self.version,
+                "vkey": self.vkey, "tokens": self.tokens, "tags": self.tags}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuilds a match from its cached form."""
+        return cls(data["path"], data["version"], data["vkey"],
+                   data["tokens"], data["tags"])
+
+
 def _glob_and_match(click, templates, prtokens, tsort, vdefault):
 
     tokens = []  # this will be a list of all the tokens found in the templates
     tdicts = []  # a list of dicts with template information
     app_matches = []
 
-    for template in templates:
+    # users often pass the same template via both the env var and the
+    # flag; scanning it twice just duplicates every match
+    for template in dict.fromkeys(templates):
 
-        if "[" in template and "]" in template:
-            version_regex = re.compile(r".*\[(?P<version>.*)\].*")
-            match = version_regex.match(template)
-            tversion = match.group('version')
-            tpath = template.replace("[", "").replace("]", "")
-            tpath = os.path.abspath(os.path.expanduser(tpath))
-        else:
+        parsed = _parse_template(template)
+        if parsed is None:
             raise click.ClickException("Error: must capture the version string in the template with brackets!")
+        tpath, tversion, token_matches = parsed
 
         tdict = {"tpath": tpath, "tversion": tversion}
         tdicts.append(tdict)
 
-        token_regex = re.compile(r"\{([a-z]*)\}")
-        token_matches = token_regex.findall(template)
-        tokens = tokens + list(set(token_matches) - set(tokens))
+        # ordered dedup, keeps token order stable across runs
+        tokens = list(dict.fromkeys(tokens + list(token_matches)))
 
     # print(tokens)
     # print(tdicts)
 
-    app_match_template = {tk: int(0) for tk in tokens}
+    app_match_template = {tk: 0 for tk in tokens}
     # print(app_match_template)
+
+    # with APPFIND_CACHE=1, a previous run's result can be reused
+    # wholesale as long as none of the directories it visited have
+    # changed since; opt-in so surprise staleness is never the default
+    use_cache = os.environ.get("APPFIND_CACHE") == "1"
+    cache_path = _cache_path(templates, prtokens, tsort, vdefault)
+    app_matches = _load_cache(cache_path) if use_cache else None
+
+    if app_matches is None:
+        app_matches = []
+        _scanned_dirs.clear()
+
+        if len(tdicts) > 1:
+            # template scans are independent and I/O bound, so overlap their
+            # syscall latency with a small thread pool
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tdicts))) as executor:
+                results = list(executor.map(
+                    lambda tdict: _scan_template(tdict, app_match_template), tdicts
+                ))
+        else:
+            results = [_scan_template(tdict, app_match_template) for tdict in tdicts]
+
+        for result in results:
+            app_matches.extend(result)
+
+        # listings are only memoized for the duration of the scan above
+        _listdir.cache_clear()
+
+        # tagging only needs the newest match overall, the newest per prtoken
+        # and the explicit default, so find those in one O(N) pass instead of
+        # sorting the whole list; list_command sorts on demand for display
+        prtoken_set = set(prtokens)
+        latest = None
+        latest_key = None
+        latest_prs = {}  # prtoken -> (key, match)
+        default = None
+        for app_match in app_matches:
+            app_match.tags = []
+            key = _sort_key(app_match, tsort)
+            # only the token values matter here, not the path/version strings
+            nonzero = {k for k, v in app_match.tokens.items() if v}
+            pr_hits = nonzero & prtoken_set
+            # track the newest version that doesnt have a prtoken as latest
+            if not pr_hits and (latest is None or key > latest_key):
+                latest = app_match
+                latest_key = key
+            # track the newest version we find with each prtoken
+            for prtoken in pr_hits:
+                if prtoken not in latest_prs or key > latest_prs[prtoken][0]:
+                    latest_prs[prtoken] = (key, app_match)
+            # track the default version (if not latest); first match
+            # wins, matching the old sorted scan
+            if default is None and vdefault and vdefault == app_match.version:
+                default = app_match
+
+        if latest is not None:
+            if not vdefault:
+                latest.tags.append('default')
+            latest.tags.append('latest')
+        if default is not None:
+            default.tags.append('default')
+        for prtoken, (key, app_match) in latest_prs.items():
+            app_match.tags.append(prtoken)
+
+        if use_cache:
+            _save_cache(cache_path, app_matches)
+
+    # pre-index the matches so launch lookups are O(1) instead of scans,
+    # first match wins just like the old linear search did
+    by_tag = {}
+    by_version = {}
+    for app_match in app_matches:
+        for tag in app_match.tags:
+            by_tag.setdefault(tag, app_match)
+        by_version.setdefault(app_match.version, app_match)
+
+    return app_matches, by_tag, by_version
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_template(template):
+    """
+    Parses a raw template string into its expanded path, version
+    template and token names. Cached so a process that resolves the
+    same templates repeatedly only ever parses each one once.
+
+    :param str template: Raw template string with the [version] brackets.
+
+    :returns: Tuple of (tpath, tversion, tokens), or None when the
+        template is missing its bracketed version section.
+    """
+    # pick the bracketed version template out with plain string scans
+    i = template.find("[")
+    j = template.find("]", i + 1)
+    if i < 0 or j < 0:
+        return None
+    tversion = template[i + 1:j]
+    tpath = os.path.expanduser(template[:i] + tversion + template[j + 1:])
+    # templates are nearly always absolute already; normpath alone skips
+    # the getcwd() syscall abspath would make per template
+    tpath = os.path.normpath(tpath) if os.path.isabs(tpath) else os.path.abspath(tpath)
+    return tpath, tversion, tuple(_TOKEN_RE.findall(template))
+
+
+def _scan_template(tdict, app_match_template):
+    """
+    Scans one template for executables and builds its _AppMatch records.
+
+    Split out from _glob_and_match so templates can be scanned
+    concurrently; each call only reads shared state and appends to its
+    own result list.
+
+    :param dict tdict: Template info with 'tpath' and 'tversion' keys.
+    :param dict app_match_template: Base dict seeding every token to 0.
+
+    :returns: List of _AppMatch records for the template.
+    """
     app_matches = []
 
-    for tdict in tdicts:
+    # iterate over each executable found for the template, using the
+    # token values captured during the walk
+    for glob_path, token_matches in _glob_template(tdict["tpath"]):
+
+        # print(glob_path)
+        token_matches = {k: int(v) for k, v in token_matches.items()}
+        version = tdict["tversion"].format(**token_matches)  # create the version
 
-        glob_pattern = _format(
-            tdict["tpath"], dict((key, "*") for key in tokens)
+        token_values = app_match_template.copy()
+        token_values.update(token_matches)
+        app_matches.append(
+            _AppMatch(glob_path, version, _version_key(version), token_values)
         )
 
-        globs = glob.glob(glob_pattern)
-        # print(globs)
+    return app_matches
 
-        # tdict["globs"] = globs
 
-        exec_regex_pattern = _format(
-            tdict["tpath"],
-            # Put () around the provided expressions so that they become capture groups.
-            dict(
-                (key, [r"(?P=%s)" % key, r"(?P<%s>\d+)" % key]) for key in tokens
-            ),
-        )
+def _sort_key(app_match, tsort):
+    """
+    Returns the key a match sorts by, newest first: the requested token
+    tuple when --tsort is given, the natural version key otherwise.
+    """
+    if tsort:
+        return tuple(app_match.tokens[k] for k in tsort)
+    return app_match.vkey
+
+
+def _sort_matches(app_matches, tsort):
+    """
+    Returns the matches sorted newest-first for display. Kept out of
+    _glob_and_match so the launch path never pays for a full sort.
+    """
+    # decorate-sort-undecorate: pull the sort keys out in one pass up
+    # front instead of doing dict lookups on every comparison
+    keys = [_sort_key(m, tsort) for m in app_matches]
+    decorated = sorted(zip(keys, app_matches), key=_DECORATED_KEY, reverse=True)
+    return [m for _, m in decorated]
+
+
+def _version_key(version):
+    """
+    Splits a version string into a tuple that sorts naturally, so that
+    '10.0' orders above '2.0' instead of below it like a plain string
+    compare would. Chunks are type-tagged so digit and non-digit chunks
+    never compare against each other directly.
+
+    :param str version: The version string built from the template.
+
+    :returns: Tuple of (tag, chunk) pairs suitable as a sort key.
+    """
+    return tuple(
+        (1, int(x)) if x.isdigit() else (0, x.lower())
+        for x in _VSPLIT_RE.split(version) if x
+    )
 
-        # accumulate the software version objects to return. this will include
-        # include the head/tail anchors in the regex
-        exec_regex_pattern = "^%s$" % (exec_regex_pattern,)
-        # print(exec_regex_pattern)
 
-        # compile the regex
-        exec_regex = re.compile(exec_regex_pattern, re.IGNORECASE)
-        # print(exec_regex)
+def _glob_template(tpath):
+    """
+    Expands a template path into the existing paths that match it, along
+    with the token values captured from each path.
 
-        # tdict["exec_regex"] = exec_regex
+    Jumps straight to the longest tokenless prefix of the template, then
+    walks down one segment at a time with os.scandir, matching entries
+    against a per-segment regex that captures the segment's tokens. This
+    only ever lists directories that could plausibly match, unlike glob
+    which expands every '*' level exhaustively and re-stats each
+    candidate, and it replaces the old whole-path backreference regex
+    with plain equality checks on the captured values.
 
-        # print(tdict)
-        # iterate over each executable found for the glob pattern and find
-        # matched components via the regex
-        for glob_path in globs:
+    :param str tpath: Template path with the brackets stripped out.
 
-            # print(glob_path)
-            match = exec_regex.match(glob_path)
-            # print(match)
-            if not match:
+    :returns: List of (path, token_matches) tuples, where token_matches
+        maps each token name to the digit string it captured.
+    """
+    segments = tpath.split(os.sep)
+
+    # everything before the first tokenized segment is a fixed prefix we
+    # can jump to directly without listing anything
+    static = 0
+    while static < len(segments) and "{" not in segments[static]:
+        static += 1
+    prefix = os.sep.join(segments[:static]) or os.sep
+
+    if static == len(segments):
+        if os.path.exists(prefix):
+            return [(prefix, {})]
+        _record_ancestor(prefix)
+        return []
+    if not os.path.isdir(prefix):
+        _record_ancestor(prefix)
+        return []
+
+    # most templates mention each token once; only repeated tokens need
+    # their captures checked for agreement below
+    occurrences = _TOKEN_RE.findall(tpath)
+    repeats = len(occurrences) != len(set(occurrences))
+
+    matches = [(prefix, {})]
+    for depth, segment in enumerate(segments[static:], start=static):
+        last = (depth == len(segments) - 1)
+        matcher = _segment_matcher(segment)
+        next_matches = []
+        for path, captured in matches:
+            for name, is_dir, entry_path in _listdir(path):
+                # only descend into directories when the template
+                # has deeper segments left to match
+                if not last and not is_dir:
+                    continue
+                token_matches = matcher(name)
+                if token_matches is None:
+                    continue
+                # a token repeated across segments has to capture the same
+                # text at every occurrence, just like the backreferences
+                # did in the old whole-path regex
+                if repeats and any(captured.get(k, v) != v for k, v in token_matches.items()):
+                    continue
+                next_matches.append((entry_path, {**captured, **token_matches}))
+        matches = next_matches
+
+    return matches
+
+
+def _record_ancestor(path):
+    """
+    Stats the deepest existing ancestor of a missing template prefix
+    into _scanned_dirs. Installing the app later changes that ancestor's
+    mtime, so the on-disk cache notices directories that didn't exist
+    when the scan ran instead of returning the empty result forever.
+    """
+    while path:
+        try:
+            _scanned_dirs[path] = os.stat(path).st_mtime_ns
+            return
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return
+            path = parent
+
+
+@functools.lru_cache(maxsize=None)
+def _segment_matcher(segment):
+    """
+    Builds the matcher for one template path segment, a callable taking
+    an entry name and returning a dict of captured token values, or None
+    when the name doesn't match.
+
+    The segment splits into alternating literal and token parts, which a
+    small scanning loop matches in a single left-to-right pass: literals
+    compare case-insensitively and each token consumes a maximal digit
+    run. Unlike interpolating user template text into a backtracking
+    regex, the scan is linear in the name length no matter what the
+    template looks like. Ambiguous shapes the scan can't resolve (two
+    tokens with no literal between them, or a literal starting with a
+    digit right after a token) fall back to an escaped regex.
+    """
+    # split the segment into (is_token, text) parts
+    parts = []
+    pos = 0
+    for token in _TOKEN_RE.finditer(segment):
+        if token.start() > pos:
+            parts.append((False, segment[pos:token.start()]))
+        parts.append((True, token.group(1)))
+        pos = token.end()
+    if pos < len(segment):
+        parts.append((False, segment[pos:]))
+
+    # the scan commits to the longest digit run per token, so a token
+    # bleeding into the next part's digits needs real backtracking
+    ambiguous = any(
+        is_token and idx + 1 < len(parts) and (
+            parts[idx + 1][0] or parts[idx + 1][1][0].isdigit()
+        )
+        for idx, (is_token, text) in enumerate(parts)
+    )
+    if ambiguous:
+        pattern = ""
+        seen = set()
+        for is_token, text in parts:
+            if not is_token:
+                pattern += re.escape(text)
+            elif text in seen:
+                pattern += r"(?P=%s)" % text
+            else:
+                seen.add(text)
+                pattern += r"(?P<%s>\d+)" % text
+        # ASCII keeps IGNORECASE on the cheap case-table path and pins
+        # \d to [0-9], which is all int() accepts downstream anyway
+        segment_regex = re.compile(pattern, re.IGNORECASE | re.ASCII)
+
+        def match(name):
+            found = segment_regex.fullmatch(name)
+            return found.groupdict() if found else None
+
+        return match
+
+    # plain literal segments (intermediate folders, the executable name
+    # itself) are the most common shape by far; specialize them down to
+    # one string comparison
+    if len(parts) == 1 and not parts[0][0]:
+        literal = parts[0][1].lower()
+
+        def match(name):
+            return {} if name.lower() == literal else None
+
+        return match
+
+    # lowercase the literals once so the scan only folds the name
+    scan_parts = [
+        (is_token, text if is_token else text.lower()) for is_token, text in parts
+    ]
+
+    def match(name):
+        lowered = name.lower()
+        found = {}
+        pos = 0
+        for is_token, text in scan_parts:
+            if not is_token:
+                if not lowered.startswith(text, pos):
+                    return None
+                pos += len(text)
                 continue
+            end = pos
+            while end < len(name) and "0" <= name[end] <= "9":
+                end += 1
+            if end == pos:
+                return None
+            value = name[pos:end]
+            # a token repeated inside one segment has to agree with itself
+            if found.setdefault(text, value) != value:
+                return None
+            pos = end
+        return found if pos == len(name) else None
 
-            token_matches = match.groupdict()  # get a dict of all token matches
-            token_matches = {k: int(v) for k, v in token_matches.items()}
-            version = tdict["tversion"].format(**token_matches)  # create the version
+    return match
 
-            app_match = copy.copy(app_match_template)
-            app_match['path'] = glob_path
-            app_match['version'] = version
-            app_match.update(token_matches)
-            app_matches.append(app_match)
 
-    if app_matches and tsort:
-        app_matches = sorted(app_matches, key=operator.itemgetter(*tsort), reverse=True)
-    elif app_matches:
-        app_matches = sorted(app_matches, key=operator.itemgetter('version'), reverse=True)
+# directories visited by the current scan and their mtimes at the time,
+# recorded so the on-disk cache knows what to validate against
+_scanned_dirs = {}
 
-    found_latest = False
-    found_default = False
-    for app_match in app_matches:
-        if found_latest and found_default and not prtokens:
-            break
-        app_match["tags"] = []
-        # tag the version item that doesnt have a prtoken as latest
-        if not found_latest and not any(x in prtokens for x in [k for k, v in app_match.items() if v is not 0]):
-            if not vdefault:
-                app_match["tags"].append('default')
-            app_match["tags"].append('latest')
-            found_latest = True
-        # tag the default version (if not latest)
-        if vdefault and vdefault == app_match["version"]:
-            app_match["tags"].append('default')
-            found_default = True
-        # tag the fist versions we find with a prtoken
-        for prtoken in [k for k, v in app_match.items() if (v is not 0 and k in prtokens)]:
-            app_match["tags"].append(prtoken)
-            prtokens.pop(prtokens.index(prtoken))
 
-    return app_matches
+@functools.lru_cache(maxsize=None)
+def _listdir(path):
+    """
+    Lists a directory, returning (name, is_dir, path) tuples.
+
+    Templates routinely share path prefixes (e.g. different executables
+    inside the same app folder), so listings are memoized to amortize the
+    underlying getdents/stat syscalls across templates. _glob_and_match
+    clears the cache when it finishes scanning so a long-running process
+    never reuses stale listings.
+    """
+    try:
+        _scanned_dirs[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as entries:
+            return tuple((entry.name, entry.is_dir(), entry.path) for entry in entries)
+    except OSError:
+        return ()
 
 
-def _format(template, tokens):
+def _cache_path(templates, prtokens, tsort, vdefault):
     """
-    Limited implementation of Python 2.6-like str.format.
+    Returns the on-disk cache file for one combination of CLI options.
+    """
+    key = repr((tuple(templates), tuple(prtokens), tuple(tsort), vdefault))
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(os.path.expanduser("~/.cache/appfind"), digest + ".json")
 
-    :param str template: String using {<name>} tokens for substitution.
-    :param dict tokens: Dictionary of <name> to substitute for <value>.
 
-    :returns: The substituted string, when "<name>" will yield "<value>".
+def _load_cache(cache_path):
     """
-    for key, value in tokens.items():
-        if isinstance(value, list):
-            template = template.replace("{%s}" % key, value[0]).replace(value[0], value[1], 1)
-        else:
-            template = template.replace("{%s}" % key, value)
+    Loads the cached matches as long as every directory the original scan
+    visited still has the same mtime, turning repeat invocations into one
+    stat per directory plus a JSON read. Any change or read problem falls
+    back to a full rescan, so invalidation stays conservative.
 
-    return template
+    :param str cache_path: Cache file from _cache_path.
+
+    :returns: The cached list of _AppMatch records, or None on a miss.
+    """
+    try:
+        with open(cache_path) as cache_file:
+            cached = json.load(cache_file)
+        # a result with nothing to validate against could never
+        # invalidate, so treat it as a miss
+        if not cached["dirs"]:
+            return None
+        for path, mtime_ns in cached["dirs"].items():
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return None
+        return [_AppMatch.from_dict(match) for match in cached["matches"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cache(cache_path, app_matches):
+    """
+    Atomically writes the scan result alongside the directory mtimes that
+    validate it. Failures are swallowed; the cache is only an accelerator.
+
+    :param str cache_path: Cache file from _cache_path.
+    :param list app_matches: The fully tagged _AppMatch records to store.
+    """
+    if not _scanned_dirs:
+        # nothing to validate against would mean a cache that never
+        # invalidates; don't write one
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w") as cache_file:
+            json.dump(
+                {"dirs": _scanned_dirs,
+                 "matches": [match.to_dict() for match in app_matches]},
+                cache_file,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
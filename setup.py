@@ -6,13 +6,13 @@ setup(
     description='A universal app finder and wrapper',
     author='Anthony Kramer',
     author_email='anthony.kramer@gmail.com',
-    py_modules=['appfind', 'click_default_group'],
+    py_modules=['appfind'],
     install_requires=[
         'click',
         'tabulate',
     ],
     entry_points='''
         [console_scripts]
-        appfind=appfind:cli
+        appfind=appfind:main
     ''',
 )